@@ -2,25 +2,129 @@
 
 import rclpy
 from rclpy.node import Node
+from rclpy.executors import SingleThreadedExecutor, ExternalShutdownException
+from rclpy.logging import LoggingSeverity
 from rcl_interfaces.msg import Log
 import re
+import functools
+import hashlib
+import pickle
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 import yaml
-from typing import List, Dict, Tuple, Pattern, Any
+from typing import List, Dict, Tuple, Pattern, Any, Optional, NamedTuple
 import os
 import sys
+import threading
+
+try:
+    # LibYAML-backed loader; requires PyYAML built against libyaml (libyaml-dev)
+    from yaml import CSafeLoader
+except ImportError:
+    from yaml import SafeLoader as CSafeLoader
 
 from PySide2 import QtCore
 from PySide2.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QScrollArea, QFrame, QSizePolicy, QGridLayout
 )
-from PySide2.QtCore import Qt
+from PySide2.QtCore import Qt, Signal
 from PySide2.QtGui import QColor, QPalette
 
 
+# Patterns used for every /rosout message, compiled once at import time
+_ANSI_RE = re.compile(r'\x1B\[[0-?]*[ -/]*[@-~]')
+# Statistics block pattern; the frequency may be 'nan'
+_BLOCK_RE = re.compile(
+    r"Statistics for topic (.+?)\n"
+    r"Message count = (\d+), Message frequency = ([\d.]+|nan)"
+)
+
+# Characters that mark a configured topic name as a regular expression
+_REGEX_METACHARS = frozenset('*+?^$[](){}|\\')
+# Flags of a pattern compiled without inline global flags such as (?i)
+_DEFAULT_REGEX_FLAGS = re.compile('').flags
+# References to groups by number or name: backreferences (\1, (?P=name)) and
+# conditionals ((?(1)...)). May over-match (e.g. an escaped backslash before a digit),
+# which only means the patterns are matched one by one.
+_GROUP_REFERENCE_RE = re.compile(r'\\[1-9]|\(\?P=|\(\?\(')
+
+# Parsed YAML configs are cached here, one file per config path. Each entry stores
+# the version, mtime and size it was built from and is overwritten when they differ.
+# Bump the version when the cached format changes.
+_YAML_CACHE_VERSION = 2
+_YAML_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'topic_notifier'
+)
+
+
+class ValidationResult(NamedTuple):
+    """Result of checking one topic's frequency against its HZ range setting."""
+    topic: str
+    frequency: float
+    expected_range: str
+    status: str
+    config_source: str
+
+
+def _load_yaml_cached(full_path: str) -> Any:
+    """
+    Load a YAML file, reusing the parsed result from the on-disk cache when the file is unchanged.
+    Cache read/write failures are ignored and fall back to parsing the file.
+    """
+    stat = os.stat(full_path)
+    cache_key = (_YAML_CACHE_VERSION, stat.st_mtime_ns, stat.st_size)
+    # sha256 rather than md5, which is unavailable on FIPS-enabled hosts
+    path_hash = hashlib.sha256(os.path.abspath(full_path).encode()).hexdigest()
+    cache_path = os.path.join(_YAML_CACHE_DIR, path_hash + '.pkl')
+
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_key, cached_data = pickle.load(f)
+        if cached_key == cache_key:
+            return cached_data
+    except Exception:
+        pass
+
+    # A large buffer lets the whole config arrive in one or two read() calls
+    with open(full_path, 'r', encoding='utf-8', buffering=1 << 20) as f:
+        data = yaml.load(f, Loader=CSafeLoader)
+
+    try:
+        os.makedirs(_YAML_CACHE_DIR, exist_ok=True)
+        # Write to a temporary file first so a concurrent reader never sees a partial pickle
+        fd, tmp_path = tempfile.mkstemp(dir=_YAML_CACHE_DIR, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump((cache_key, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+    except Exception:
+        pass
+
+    return data
+
+
 class TopicStatusWidget(QFrame):
     """Widget to display the status of a single topic."""
     
+    # Background palettes shared by all instances; built on first use since
+    # QPalette needs a QApplication
+    _PALETTE_NG = None
+    _PALETTE_OK = None
+    _PALETTE_OTHER = None
+    
+    @classmethod
+    def _initPalettes(cls):
+        cls._PALETTE_NG = QPalette()
+        cls._PALETTE_NG.setColor(QPalette.Window, QColor(255, 200, 200))  # Light red
+        cls._PALETTE_OK = QPalette()
+        cls._PALETTE_OK.setColor(QPalette.Window, QColor(200, 255, 200))  # Light green
+        cls._PALETTE_OTHER = QPalette()
+        cls._PALETTE_OTHER.setColor(QPalette.Window, QColor(255, 255, 200))  # Light yellow
+        
     def __init__(self, topic_name, frequency, expected_range, status, parent=None):
         super().__init__(parent)
         self.topic_name = topic_name
@@ -39,52 +143,68 @@ class TopicStatusWidget(QFrame):
         
         layout = QVBoxLayout(self)
         
-        # Topic name
-        self.topic_label = QLabel(self.topic_name)
-        self.topic_label.setStyleSheet("font-weight: bold;")
-        layout.addWidget(self.topic_label)
+        # Topic name (static; the layout owns the label, so no reference is kept)
+        topic_label = QLabel(self.topic_name)
+        topic_label.setStyleSheet("font-weight: bold;")
+        layout.addWidget(topic_label)
         
         # Frequency and expected range
         info_layout = QHBoxLayout()
-        self.freq_label = QLabel(f"Frequency: {self.frequency:.2f} Hz")
-        self.range_label = QLabel(f"Expected: {self.expected_range}")
+        self._last_freq_text = f"Frequency: {self.frequency:.2f} Hz"
+        self.freq_label = QLabel(self._last_freq_text)
+        range_label = QLabel(f"Expected: {self.expected_range}")
         info_layout.addWidget(self.freq_label)
-        info_layout.addWidget(self.range_label)
+        info_layout.addWidget(range_label)
         layout.addLayout(info_layout)
         
-        # Status
-        self.status_label = QLabel(f"Status: {self.status}")
+        # Status (text and background color are set by updateStatus)
+        self._last_status_text = ''
+        self.status_label = QLabel()
         layout.addWidget(self.status_label)
         
     def updateStatus(self, status):
         self.status = status
-        self.status_label.setText(f"Status: {self.status}")
+        
+        # setText and setPalette trigger a relayout/repaint even for unchanged values
+        status_text = f"Status: {self.status}"
+        if status_text == self._last_status_text:
+            return
+        self._last_status_text = status_text
+        self.status_label.setText(status_text)
         
         # Set background color based on status
-        palette = self.palette()
+        if TopicStatusWidget._PALETTE_NG is None:
+            TopicStatusWidget._initPalettes()
         if status == 'NG':
-            palette.setColor(QPalette.Window, QColor(255, 200, 200))  # Light red
+            palette = self._PALETTE_NG
         elif status == 'OK':
-            palette.setColor(QPalette.Window, QColor(200, 255, 200))  # Light green
+            palette = self._PALETTE_OK
         else:
-            palette.setColor(QPalette.Window, QColor(255, 255, 200))  # Light yellow
+            palette = self._PALETTE_OTHER
         
         self.setAutoFillBackground(True)
         self.setPalette(palette)
         
     def updateFrequency(self, frequency):
         self.frequency = frequency
-        self.freq_label.setText(f"Frequency: {self.frequency:.2f} Hz")
+        freq_text = f"Frequency: {self.frequency:.2f} Hz"
+        if freq_text != self._last_freq_text:
+            self._last_freq_text = freq_text
+            self.freq_label.setText(freq_text)
 
 
 class TopicNotifierGUI(QMainWindow):
     """Main window for the Topic Notifier application."""
     
+    # Emitted with the list of validation results of one /rosout message. Declared as
+    # object so the Python list is passed by reference instead of converted to QVariantList.
+    batch_signal = Signal(object)
+    
     def __init__(self):
         super().__init__()
         self.topic_widgets = {}  # Dictionary to store topic widgets
         self.setupUI()
-        self.should_exit = False  # Flag to indicate if the application should exit
+        self.batch_signal.connect(self._applyBatch)
         
     def setupUI(self):
         self.setWindowTitle("ROS2 Topic Frequency Monitor")
@@ -128,38 +248,46 @@ class TopicNotifierGUI(QMainWindow):
         # Status bar
         self.statusBar().showMessage("Monitoring topics...")
         
-    def closeEvent(self, event):
-        """Handle window close event."""
-        self.should_exit = True
-        event.accept()
-        
     def clearAllTopics(self):
         """Clear all topic widgets."""
-        for widget in self.topic_widgets.values():
-            widget.setParent(None)
+        # Empty the layout in one go and let Qt delete the widgets, instead of
+        # reparenting each widget (and invalidating the layout) one at a time
+        while (item := self.topics_layout.takeAt(0)) is not None:
+            widget = item.widget()
+            if widget is not None:
+                widget.deleteLater()
         self.topic_widgets.clear()
         
-    def updateTopicStatus(self, topic_name, frequency, expected_range, status):
-        """Update or add a topic status widget."""
-        # Only display topics with NG status
-        if status == 'NG':
-            if topic_name in self.topic_widgets:
-                # Update existing widget
-                widget = self.topic_widgets[topic_name]
-                widget.updateFrequency(frequency)
-                widget.updateStatus(status)
-            else:
-                # Create new widget
-                widget = TopicStatusWidget(topic_name, frequency, expected_range, status)
-                self.topic_widgets[topic_name] = widget
-                self.topics_layout.addWidget(widget)
-        elif topic_name in self.topic_widgets:
-            # Remove widget if status changed from NG to something else
-            widget = self.topic_widgets[topic_name]
-            widget.setParent(None)
-            del self.topic_widgets[topic_name]
-        
-        # Update status bar
+    def _applyBatch(self, validation_results):
+        """Apply all validation results of one message with a single repaint."""
+        # Latest result per topic; topics not reported in this message keep their widget
+        latest_results = {result.topic: result for result in validation_results}
+        ng_results = {topic: result for topic, result in latest_results.items() if result.status == 'NG'}
+        
+        # Only widgets whose NG state changed are added or removed; the rest just get the new frequency
+        removed = self.topic_widgets.keys() & (latest_results.keys() - ng_results.keys())
+        
+        self.topics_container.setUpdatesEnabled(False)
+        try:
+            for topic_name in removed:
+                # Same cleanup as clearAllTopics: take it out of the layout and let Qt delete it
+                widget = self.topic_widgets.pop(topic_name)
+                self.topics_layout.removeWidget(widget)
+                widget.deleteLater()
+            for topic_name, result in ng_results.items():
+                widget = self.topic_widgets.get(topic_name)
+                if widget is None:
+                    widget = TopicStatusWidget(topic_name, result.frequency, result.expected_range, result.status)
+                    self.topic_widgets[topic_name] = widget
+                    self.topics_layout.addWidget(widget)
+                else:
+                    widget.updateFrequency(result.frequency)
+        finally:
+            self.topics_container.setUpdatesEnabled(True)
+        self._updateStatusBar()
+        
+    def _updateStatusBar(self):
+        """Show the number of NG topics in the status bar."""
         ng_count = len(self.topic_widgets)
         self.statusBar().showMessage(f"Monitoring topics... {ng_count} issues found")
 
@@ -186,6 +314,12 @@ class TopicNotifier(Node):
         # Load configuration from YAML files
         self.exact_hz_configs, self.regex_hz_configs = self.load_hz_range_config_from_files(yaml_filepaths)
         
+        # Topic names and configs are stable, so memoize topic -> config resolution
+        self._resolve_topic = functools.lru_cache(maxsize=4096)(self._resolve_topic_impl)
+        
+        # Cache whether INFO is emitted so per-message log formatting can be skipped
+        self._info_enabled = self.get_logger().is_enabled_for(LoggingSeverity.INFO)
+        
         # Log loaded configurations
         self.log_configurations()
         
@@ -204,52 +338,39 @@ class TopicNotifier(Node):
         Callback for /rosout messages.
         Processes messages from the target node containing topic statistics.
         """
-        # Check if the message is from our target node
-        if self.target_node_name in msg.name:
+        # Drop messages from other nodes before doing any other work
+        if self.target_node_name not in msg.name:
+            return
+        
+        if self._info_enabled:
             self.get_logger().info(f"Received message from {msg.name}")
+        
+        # Parse the topic statistics from the message
+        parsed_topic_stats = self.parse_ros_topic_statistics(msg.msg)
+        
+        if parsed_topic_stats:
+            # Validate the topic frequencies
+            validation_results = self.check_topic_frequencies(parsed_topic_stats)
             
-            # Parse the topic statistics from the message
-            parsed_topic_stats = self.parse_ros_topic_statistics(msg.msg)
+            # Update GUI with results
+            self.gui.batch_signal.emit(validation_results)
             
-            if parsed_topic_stats:
-                # Validate the topic frequencies
-                validation_results = self.check_topic_frequencies(
-                    parsed_topic_stats, 
-                    self.exact_hz_configs, 
-                    self.regex_hz_configs
-                )
-                
-                # Update GUI with results
-                for result in validation_results:
-                    self.gui.updateTopicStatus(
-                        result['topic'],
-                        result['frequency'],
-                        result['expected_range'],
-                        result['status']
-                    )
-                
-                # Log the results
-                self.log_validation_results(validation_results)
-            else:
-                self.get_logger().info("No topic statistics found in the message")
+            # Log the results
+            self.log_validation_results(validation_results)
+        else:
+            self.get_logger().info("No topic statistics found in the message")
 
     def parse_ros_topic_statistics(self, msg_str: str) -> List[Dict[str, Any]]:
         """
         Parse ROS topic statistics from a string message.
         """
-        ansi_escape_pattern = re.compile(r'\x1B\[[0-?]*[ -/]*[@-~]')
-        cleaned_str = ansi_escape_pattern.sub('', msg_str)
-        
-        # Modified pattern to handle 'nan' values
-        block_pattern = re.compile(
-            r"Statistics for topic (.+?)\n"
-            r"Message count = (\d+), Message frequency = ([\d.]+|nan)"
-        )
+        # Most messages carry no ANSI escapes; skip the regex pass when there is no ESC byte
+        cleaned_str = _ANSI_RE.sub('', msg_str) if '\x1b' in msg_str else msg_str
         
         self.get_logger().debug(f"Parsing message: {cleaned_str}")
         
         results = []
-        for match in block_pattern.finditer(cleaned_str):
+        for match in _BLOCK_RE.finditer(cleaned_str):
             topic_name = match.group(1).strip()
             message_count = int(match.group(2))
             
@@ -269,7 +390,7 @@ class TopicNotifier(Node):
             })
         
         if not results:
-            self.get_logger().debug(f"No matches found in message. Regex pattern: {block_pattern.pattern}")
+            self.get_logger().debug(f"No matches found in message. Regex pattern: {_BLOCK_RE.pattern}")
             # Log a sample of the message to help with debugging
             if len(cleaned_str) > 200:
                 self.get_logger().debug(f"Message sample: {cleaned_str[:200]}...")
@@ -278,6 +399,66 @@ class TopicNotifier(Node):
         
         return results
 
+    def _load_hz_range_config_from_file(self, filepath: str) -> Tuple[Dict[str, Dict[str, float]], List[Tuple[Pattern, Dict[str, float]]], List[Tuple[str, str]]]:
+        """
+        Load topic HZ range settings from a single YAML file.
+        Runs in a worker thread, so log messages are returned as (severity, message)
+        pairs instead of being logged directly.
+        """
+        exact_match_configs = {}
+        regex_configs = []
+        candidate_regexes = []
+        log_messages = []
+
+        try:
+            # Try to find the file in the package directory if it's not an absolute path
+            if not os.path.isabs(filepath):
+                # Check current directory first
+                if os.path.exists(filepath):
+                    full_path = filepath
+                else:
+                    # Could add package path resolution here if needed
+                    full_path = filepath
+            else:
+                full_path = filepath
+            
+            data = _load_yaml_cached(full_path)
+            if data and 'topics' in data:
+                for topic_entry in data['topics']:
+                    name = topic_entry.get('name')
+                    hz_range_list = topic_entry.get('hz_range')
+
+                    if name and hz_range_list and len(hz_range_list) == 2:
+                        try:
+                            config = {'min': float(hz_range_list[0]), 'max': float(hz_range_list[1])}
+                        except ValueError:
+                            log_messages.append(('warning', f"Invalid hz_range format for topic '{name}' in file '{filepath}': {hz_range_list}"))
+                            continue
+
+                        # Check if the name contains regex patterns
+                        if _REGEX_METACHARS.isdisjoint(name):
+                            exact_match_configs[name] = config
+                        else:
+                            candidate_regexes.append((name, config))
+        except FileNotFoundError:
+            log_messages.append(('error', f"YAML file not found at '{filepath}'"))
+        except yaml.YAMLError as e:
+            log_messages.append(('error', f"Error parsing YAML file '{filepath}': {e}"))
+        except Exception as e:
+            log_messages.append(('error', f"An unexpected error occurred while processing YAML file '{filepath}': {e}"))
+
+        # Compile the regex topic names in one pass and report invalid ones together
+        invalid_regexes = []
+        for name, config in candidate_regexes:
+            try:
+                regex_configs.append((re.compile(name), config))
+            except re.error as e:
+                invalid_regexes.append(f"'{name}': {e}")
+        if invalid_regexes:
+            log_messages.append(('warning', f"Invalid regex patterns in file '{filepath}': " + "; ".join(invalid_regexes)))
+
+        return exact_match_configs, regex_configs, log_messages
+
     def load_hz_range_config_from_files(self, yaml_filepaths_list: List[str]) -> Tuple[Dict[str, Dict[str, float]], List[Tuple[Pattern, Dict[str, float]]]]:
         """
         Load topic HZ range settings from multiple YAML files.
@@ -286,51 +467,64 @@ class TopicNotifier(Node):
         exact_match_configs = {}
         regex_configs = []
 
-        for filepath in yaml_filepaths_list:
+        # Load the files concurrently; results are merged in the given file order
+        results = []
+        if yaml_filepaths_list:
+            with ThreadPoolExecutor(max_workers=min(8, len(yaml_filepaths_list))) as executor:
+                results = list(executor.map(self._load_hz_range_config_from_file, yaml_filepaths_list))
+
+        for file_exact_configs, file_regex_configs, log_messages in results:
+            exact_match_configs.update(file_exact_configs)
+            regex_configs.extend(file_regex_configs)
+            for severity, message in log_messages:
+                getattr(self.get_logger(), severity)(message)
+
+        # Combine all regex patterns into one alternation so a topic is resolved
+        # with a single match; the named group 'g<i>' identifies the winning entry.
+        # The trailing \Z anchor lets the hot path use match() instead of fullmatch().
+        # Ordinary groups are fine since the outer 'g<i>' group closes last. Patterns that
+        # reference groups or use inline global flags are matched one by one instead: inside
+        # the combined regex group numbers shift (silently breaking backreferences and
+        # conditionals), and a global flag would no longer be at the start of the
+        # expression (an error on Python 3.11, applied to every pattern on 3.10).
+        self._combined_regex = None
+        if regex_configs and any(
+            _GROUP_REFERENCE_RE.search(pattern.pattern) or pattern.flags != _DEFAULT_REGEX_FLAGS
+            for pattern, _ in regex_configs
+        ):
+            self.get_logger().info("Regex patterns contain group references or inline flags, matching them individually")
+        elif regex_configs:
             try:
-                # Try to find the file in the package directory if it's not an absolute path
-                if not os.path.isabs(filepath):
-                    # Check current directory first
-                    if os.path.exists(filepath):
-                        full_path = filepath
-                    else:
-                        # Could add package path resolution here if needed
-                        full_path = filepath
-                else:
-                    full_path = filepath
-                
-                with open(full_path, 'r', encoding='utf-8') as f:
-                    data = yaml.safe_load(f)
-                    if data and 'topics' in data:
-                        for topic_entry in data['topics']:
-                            name = topic_entry.get('name')
-                            hz_range_list = topic_entry.get('hz_range')
-
-                            if name and hz_range_list and len(hz_range_list) == 2:
-                                try:
-                                    config = {'min': float(hz_range_list[0]), 'max': float(hz_range_list[1])}
-                                    # Check if the name contains regex patterns
-                                    if any(char in name for char in ['*', '+', '?', '^', '$', '[', ']', '(', ')', '{', '}', '|', '\\']):
-                                        regex_pattern = re.compile(name)
-                                        regex_configs.append((regex_pattern, config))
-                                    else:
-                                        exact_match_configs[name] = config
-                                except ValueError:
-                                    self.get_logger().warning(f"Invalid hz_range format for topic '{name}' in file '{filepath}': {hz_range_list}")
-                                except re.error as e:
-                                    self.get_logger().warning(f"Invalid regex pattern for topic '{name}' in file '{filepath}': {e}")
-            except FileNotFoundError:
-                self.get_logger().error(f"YAML file not found at '{filepath}'")
-            except yaml.YAMLError as e:
-                self.get_logger().error(f"Error parsing YAML file '{filepath}': {e}")
-            except Exception as e:
-                self.get_logger().error(f"An unexpected error occurred while processing YAML file '{filepath}': {e}")
+                self._combined_regex = re.compile('(?:' + '|'.join(
+                    f'(?P<g{i}>(?:{pattern.pattern}))' for i, (pattern, _) in enumerate(regex_configs)
+                ) + r')\Z')
+            except re.error as e:
+                # e.g. duplicate group names across patterns; fall back to matching one by one
+                self.get_logger().warning(f"Could not combine regex patterns, matching them individually: {e}")
 
         return exact_match_configs, regex_configs
 
-    def check_topic_frequencies(self, parsed_stats: List[Dict[str, Any]], 
-                               exact_match_configs: Dict[str, Dict[str, float]], 
-                               regex_configs_list: List[Tuple[Pattern, Dict[str, float]]]) -> List[Dict[str, Any]]:
+    def _resolve_topic_impl(self, topic_name: str) -> Tuple[Optional[Dict[str, float]], str]:
+        """
+        Find the HZ range setting for a topic.
+        Returns the config (or None) and a description of where it came from.
+        """
+        if topic_name in self.exact_hz_configs:
+            return self.exact_hz_configs[topic_name], f"Exact match: {topic_name}"
+
+        if self._combined_regex is not None:
+            match = self._combined_regex.match(topic_name)  # Anchored with \Z to match the entire string
+            if match:
+                pattern, config = self.regex_hz_configs[int(match.lastgroup[1:])]
+                return config, f"Regex match: {pattern.pattern}"
+        else:
+            for pattern, config in self.regex_hz_configs:
+                if pattern.fullmatch(topic_name):  # Use fullmatch to match the entire string
+                    return config, f"Regex match: {pattern.pattern}"
+
+        return None, "N/A"
+
+    def check_topic_frequencies(self, parsed_stats: List[Dict[str, Any]]) -> List[ValidationResult]:
         """
         Compare parsed topic statistics with HZ range settings and return results.
         """
@@ -339,35 +533,26 @@ class TopicNotifier(Node):
             topic_name = stat['topic']
             frequency = stat['message_frequency']
             
-            found_config = None
-            config_source_info = "N/A"
-
-            if topic_name in exact_match_configs:
-                found_config = exact_match_configs[topic_name]
-                config_source_info = f"Exact match: {topic_name}"
-            else:
-                for pattern, config in regex_configs_list:
-                    if pattern.fullmatch(topic_name):  # Use fullmatch to match the entire string
-                        found_config = config
-                        config_source_info = f"Regex match: {pattern.pattern}"
-                        break
+            found_config, config_source_info = self._resolve_topic(topic_name)
             
-            result_entry = {
-                'topic': topic_name,
-                'frequency': frequency,
-                'expected_range': "N/A",
-                'status': 'Config Not Found',
-                'config_source': config_source_info if found_config else "N/A"
-            }
-
             if found_config:
-                result_entry['expected_range'] = f"[{found_config['min']}, {found_config['max']}]"
+                expected_range = f"[{found_config['min']}, {found_config['max']}]"
                 if found_config['min'] <= frequency <= found_config['max']:
-                    result_entry['status'] = 'OK'
+                    status = 'OK'
                 else:
-                    result_entry['status'] = 'NG'
+                    status = 'NG'
+            else:
+                expected_range = "N/A"
+                status = 'Config Not Found'
+                config_source_info = "N/A"
             
-            validation_results.append(result_entry)
+            validation_results.append(ValidationResult(
+                topic=topic_name,
+                frequency=frequency,
+                expected_range=expected_range,
+                status=status,
+                config_source=config_source_info
+            ))
             
         return validation_results
 
@@ -384,17 +569,21 @@ class TopicNotifier(Node):
         else:
             self.get_logger().info("No HZ range configurations were loaded.")
 
-    def log_validation_results(self, validation_results: List[Dict[str, Any]]):
+    def log_validation_results(self, validation_results: List[ValidationResult]):
         """Log the topic frequency validation results."""
-        self.get_logger().info("--- Topic Frequency Validation Results ---")
+        if self._info_enabled:
+            self.get_logger().info("--- Topic Frequency Validation Results ---")
         for result in validation_results:
-            status_str = result['status']
+            status_str = result.status
+            # OK results are logged at INFO; skip formatting when it would be dropped
+            if status_str == 'OK' and not self._info_enabled:
+                continue
             message = (
-                f"Topic: {result['topic']}\n"
-                f"  Frequency: {result['frequency']}\n"
-                f"  Expected Range: {result['expected_range']}\n"
+                f"Topic: {result.topic}\n"
+                f"  Frequency: {result.frequency}\n"
+                f"  Expected Range: {result.expected_range}\n"
                 f"  Status: {status_str}\n"
-                f"  Config Source: {result['config_source']}"
+                f"  Config Source: {result.config_source}"
             )
             
             # Use different severity levels based on status
@@ -406,6 +595,20 @@ class TopicNotifier(Node):
                 self.get_logger().info(message)
 
 
+def _spin_ros(executor, app):
+    """
+    Spin the ROS executor until it is shut down, then quit the Qt application.
+    Runs in a background thread; GUI updates reach the main thread via queued Qt signals.
+    """
+    try:
+        executor.spin()
+    except ExternalShutdownException:
+        pass
+    finally:
+        # Quit Qt as well if ROS was shut down externally (e.g. Ctrl+C)
+        QtCore.QMetaObject.invokeMethod(app, 'quit', Qt.QueuedConnection)
+
+
 def main(args=None):
     # Initialize Qt application
     app = QApplication(sys.argv)
@@ -420,15 +623,21 @@ def main(args=None):
     # Create node with reference to GUI
     node = TopicNotifier(gui)
     
-    # Main event loop that processes both Qt and ROS events
+    # ROS events are processed in a background thread that blocks until a message arrives,
+    # while the Qt event loop blocks until there is a GUI event, so nothing polls when idle
+    executor = SingleThreadedExecutor()
+    executor.add_node(node)
+    ros_thread = threading.Thread(target=_spin_ros, args=(executor, app), daemon=True)
+    ros_thread.start()
+    
     try:
-        while not gui.should_exit:
-            app.processEvents()  # Process Qt events
-            rclpy.spin_once(node, timeout_sec=0.01)  # Process ROS events with timeout
+        app.exec_()  # Returns when the window is closed
     finally:
         # Clean up ROS resources when exiting
+        executor.shutdown()
+        ros_thread.join()
         node.destroy_node()
-        rclpy.shutdown()
+        rclpy.try_shutdown()
         sys.exit(0)
 
 